@@ -1,73 +1,468 @@
 import os
+import asyncio
+import atexit
+import contextlib
+import functools
+import gzip
+import hashlib
+import itertools
+import json
+import operator
+import random
+import re
 import requests
-import sys
 import csv
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-def fetch_groups(board_id, api_key):
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+__all__ = [
+    'MondayAPIError',
+    'MondayRateLimit',
+    'MondayGraphQLError',
+    'MAX_PAGE_LIMIT',
+    'clear_cache',
+    'fetch_groups',
+    'fetch_items',
+    'iter_items_recursive',
+    'fetch_items_recursive',
+    'fetch_items_for_groups',
+    'fetch_all_groups_items',
+    'fetch_items_recursive_async',
+    'fetch_groups_items_async',
+    'export_items_to_csv'
+]
+
+API_URL = "https://api.monday.com/v2"
+
+# Largest page size items_page and next_items_page accept. Every page is a
+# round trip, so paginated fetches default to it.
+MAX_PAGE_LIMIT = 500
+
+# Transient failures are retried with exponential backoff:
+# _BACKOFF_FACTOR * 2 ** attempt seconds, unless the API says how long to wait.
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+_MAX_RETRIES = 8
+_BACKOFF_FACTOR = 0.5
+
+# Connections the shared session keeps open to Monday.com, and so the most
+# requests it can run in parallel without reconnecting.
+_POOL_MAXSIZE = 20
+
+# Monday.com reuses error codes such as ComplexityException both for
+# throttled queries, which succeed when sent again later, and for queries
+# that can never succeed. Only the throttled ones come with a retry delay
+# or one of these messages.
+_RESET_IN = re.compile(r'reset in (\d+) seconds', re.IGNORECASE)
+_BUDGET_EXHAUSTED = 'budget exhausted'
+
+
+class MondayAPIError(Exception):
     """
-    Fetches groups from a specified Monday.com board.
+    Raised when a Monday.com request fails or returns unusable data.
+    """
+
+
+class MondayRateLimit(MondayAPIError):
+    """
+    Raised when Monday.com keeps throttling a request after every retry.
+    """
+
+
+class MondayGraphQLError(MondayAPIError):
+    """
+    Raised when Monday.com rejects a query with GraphQL errors.
+    """
+
+
+def _build_session():
+    """
+    Builds the HTTP session shared by every Monday.com call.
+
+    Keeping one session alive lets urllib3 reuse the TCP/TLS connection
+    across requests instead of opening a new one for each page.
+
+    Returns:
+        requests.Session: A session with a pooled, retrying HTTPS adapter.
+    """
+    retry = Retry(
+        total=_MAX_RETRIES,
+        backoff_factor=_BACKOFF_FACTOR,
+        status_forcelist=_RETRY_STATUSES,
+        allowed_methods=frozenset(['POST']),  # GraphQL queries are read-only
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=_POOL_MAXSIZE, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.headers.update({'Content-Type': 'application/json'})
+    return session
+
+
+_SESSION = _build_session()
+atexit.register(_SESSION.close)
+
+# Raw response bodies keyed on a hash of the API key and request body,
+# mapped to (expiry timestamp, body). HTTP caches can't help here since
+# every GraphQL call is a POST. Bodies are decoded again on every hit, so
+# callers never share, or mutate, the cached response.
+_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+
+# Expired entries are dropped when read, and swept once every this many
+# writes so that entries never read again don't accumulate.
+_CACHE_SWEEP_INTERVAL = 256
+_cache_writes = 0
+
+
+def _dumps(obj):
+    """
+    Encodes a request body as JSON, with orjson when it is installed.
 
     Args:
-        board_id (str): The ID of the board.
-        api_key (str): Your Monday.com API key.
+        obj (dict): The object to encode.
 
     Returns:
-        list: A list of groups with their IDs and titles.
+        bytes: The encoded body.
     """
-    query = """
-    query ($boardId: [ID!]!) {
-      boards(ids: $boardId) {
-        groups {
-          id
-          title
-        }
-      }
-    }
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(content):
     """
+    Decodes a JSON response body, with orjson when it is installed.
 
-    variables = {
-        "boardId": [str(board_id)]  
+    Args:
+        content (bytes): The raw response body.
+
+    Returns:
+        dict: The decoded response.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _backoff(attempt, hint=None):
+    """
+    Computes how long to wait before retrying a request.
+
+    Args:
+        attempt (int): Number of attempts made so far, starting at 0.
+        hint (str): Optional delay in seconds suggested by the API, such as a
+            `Retry-After` header.
+
+    Returns:
+        float: Seconds to sleep, including random jitter so that concurrent
+            clients don't retry in lockstep.
+    """
+    try:
+        delay = float(hint)
+    except (TypeError, ValueError):
+        delay = _BACKOFF_FACTOR * 2 ** attempt
+    return delay + random.uniform(0, _BACKOFF_FACTOR)
+
+
+def _throttle_hint(data):
+    """
+    Checks whether a GraphQL response was throttled by Monday.com.
+
+    A response counts as throttled only if the API says when to retry,
+    through `retry_in_seconds` or a "reset in N seconds" or "budget
+    exhausted" message. Other errors, such as a query exceeding the maximum
+    complexity, are left for `_check_errors` to raise.
+
+    Args:
+        data (dict): The decoded GraphQL response.
+
+    Returns:
+        tuple: Whether the query was throttled, and the suggested delay in
+            seconds if the API gave one.
+    """
+    errors = [(data.get('error_message') or '', {})] if 'error_code' in data else []
+    for error in data.get('errors') or []:
+        errors.append((error.get('message') or '', error.get('extensions') or {}))
+
+    for message, extensions in errors:
+        if extensions.get('retry_in_seconds') is not None:
+            return True, extensions['retry_in_seconds']
+
+        match = _RESET_IN.search(message)
+        if match:
+            return True, match.group(1)
+        if _BUDGET_EXHAUSTED in message.lower():
+            return True, None
+
+    return False, None
+
+
+def _status_error(status_code, text):
+    """
+    Builds the exception for a response with an unexpected HTTP status.
+
+    Args:
+        status_code (int): The HTTP status code.
+        text (str): The response body.
+
+    Returns:
+        MondayAPIError: The exception to raise.
+    """
+    error = MondayRateLimit if status_code == 429 else MondayAPIError
+    return error(f"Query failed with status code {status_code}: {text}")
+
+
+def _check_errors(data):
+    """
+    Raises if a GraphQL response contains errors.
+
+    Args:
+        data (dict): The decoded GraphQL response.
+
+    Raises:
+        MondayRateLimit: If the query was throttled.
+        MondayGraphQLError: If the query was rejected.
+    """
+    throttled, _ = _throttle_hint(data)
+    if 'errors' in data:
+        messages = "; ".join(error.get('message') or '' for error in data['errors'])
+        error = MondayRateLimit if throttled else MondayGraphQLError
+        raise error(f"GraphQL errors: {messages}")
+
+    if 'error_code' in data:
+        error = MondayRateLimit if throttled else MondayGraphQLError
+        raise error(f"{data['error_code']}: {data.get('error_message') or ''}")
+
+
+def _column_variables(column_ids):
+    """
+    Builds the `columnIds` query variable.
+
+    Args:
+        column_ids (list): The column IDs to fetch, or None for all columns.
+
+    Returns:
+        dict: The variable, or nothing when every column is wanted.
+    """
+    if column_ids is None:
+        return {}
+    return {"columnIds": [str(column_id) for column_id in column_ids]}
+
+
+_QUERY_ITEMS_COUNT = """
+query ($boardId: [ID!]!, $groupId: [String!]!) {
+  boards(ids: $boardId) {
+    groups(ids: $groupId) {
+      id
+      items_count
     }
+  }
+}
+"""
+
+# Monday.com pagination cursors, including those returned by next_items_page,
+# stop working an hour after the initial items_page request of their chain.
+_CURSOR_LIFETIME = 60 * 60
+
+
+def clear_cache():
+    """
+    Drops every cached Monday.com response.
+    """
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
+def _cache_key(body, api_key):
+    """
+    Hashes an encoded request body and the API key into a cache key.
+
+    Args:
+        body (bytes): The encoded GraphQL request body.
+        api_key (str): Your Monday.com API key.
+
+    Returns:
+        str: The cache key.
+    """
+    digest = hashlib.sha256(api_key.encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(body)
+    return digest.hexdigest()
+
+
+def _cache_store(key, content, cache_ttl):
+    """
+    Stores a raw response body in the cache, sweeping out expired entries
+    every `_CACHE_SWEEP_INTERVAL` writes.
+
+    Args:
+        key (str): The cache key.
+        content (bytes): The raw response body.
+        cache_ttl (float): Seconds to keep the entry.
+    """
+    global _cache_writes
+
+    now = time.monotonic()
+    with _CACHE_LOCK:
+        _CACHE[key] = (now + cache_ttl, content)
+        _cache_writes += 1
+        if _cache_writes % _CACHE_SWEEP_INTERVAL:
+            return
+
+        expired = [cached_key for cached_key, (expiry, _) in _CACHE.items() if expiry <= now]
+        for cached_key in expired:
+            del _CACHE[cached_key]
+
+
+def _run_query(query, variables, api_key, session=None, cache_ttl=0):
+    """
+    Sends a GraphQL query to the Monday.com API.
+
+    Args:
+        query (str): The GraphQL query.
+        variables (dict): Variables for the query.
+        api_key (str): Your Monday.com API key.
+        session (requests.Session): Optional session to send the request with.
+            Defaults to the shared module session.
+        cache_ttl (float): Seconds to reuse the response for identical queries.
+            The raw response stays in memory until it expires. 0 disables
+            caching.
+
+    Returns:
+        dict: The decoded GraphQL response.
+
+    Raises:
+        MondayAPIError: If the request fails; MondayRateLimit if it is still
+            throttled after every retry, MondayGraphQLError if it is rejected.
+    """
+    body = _dumps({"query": query, "variables": variables})
+
+    if cache_ttl > 0:
+        key = _cache_key(body, api_key)
+        cached = _CACHE.get(key)
+        if cached:
+            if cached[0] > time.monotonic():
+                return _loads(cached[1])
+            with _CACHE_LOCK:
+                if _CACHE.get(key) is cached:
+                    del _CACHE[key]
 
     headers = {
         'Authorization': api_key,
         'Content-Type': 'application/json'
     }
 
-    response = requests.post(
-        "https://api.monday.com/v2",
-        json={"query": query, "variables": variables},
-        headers=headers
-    )
+    # HTTP-level failures are retried by the session's adapter; this loop
+    # retries queries Monday.com accepted but throttled.
+    for attempt in range(_MAX_RETRIES + 1):
+        response = (session or _SESSION).post(
+            API_URL,
+            data=body,
+            headers=headers
+        )
 
-    if response.status_code != 200:
-        print(f"Query failed with status code {response.status_code}")
-        print("Response:", response.text)
-        sys.exit(1)
+        if response.status_code != 200:
+            raise _status_error(response.status_code, response.text)
 
-    data = response.json()
+        data = _loads(response.content)
+        throttled, hint = _throttle_hint(data)
+        if not throttled or attempt == _MAX_RETRIES:
+            break
+
+        time.sleep(_backoff(attempt, hint or response.headers.get('Retry-After')))
+
+    _check_errors(data)
+
+    if cache_ttl > 0:
+        _cache_store(key, response.content, cache_ttl)
+    return data
 
-    if 'errors' in data:
-        print("GraphQL Errors:")
-        for error in data['errors']:
-            print(error['message'])
-        sys.exit(1)
+
+_QUERY_GROUPS = """
+query ($boardId: [ID!]!) {
+  boards(ids: $boardId) {
+    groups {
+      id
+      title
+      items_count
+    }
+  }
+}
+"""
+
+
+def fetch_groups(board_id, api_key, session=None, cache_ttl=300):
+    """
+    Fetches groups from a specified Monday.com board.
+
+    Args:
+        board_id (str): The ID of the board.
+        api_key (str): Your Monday.com API key.
+        session (requests.Session): Optional session to send the request with.
+            Defaults to the shared module session.
+        cache_ttl (float): Seconds to reuse the response for repeated calls.
+            Groups rarely change, so this defaults to 5 minutes; 0 disables it.
+
+    Returns:
+        list: A list of groups with their IDs, titles and item counts.
+
+    Raises:
+        MondayAPIError: If the request fails, or the board doesn't exist or has no groups.
+    """
+    variables = {
+        "boardId": [str(board_id)]  
+    }
+
+    data = _run_query(_QUERY_GROUPS, variables, api_key, session, cache_ttl)
 
     boards = data.get('data', {}).get('boards', [])
     if not boards:
-        print(f"No boards found with ID {board_id}.")
-        sys.exit(1)
+        raise MondayAPIError(f"No boards found with ID {board_id}.")
 
     board = boards[0]
     groups = board.get('groups', [])
 
     if not groups:
-        print(f"No groups found in board {board_id}.")
-        sys.exit(1)
+        raise MondayAPIError(f"No groups found in board {board_id}.")
 
     return groups
 
-def fetch_items(board_id, group_id, api_key, limit=10):
+
+_QUERY_ITEMS = """
+query ($boardId: [ID!]!, $groupId: [String!]!, $limit: Int!, $columnIds: [String!]) {
+  boards(ids: $boardId) {
+    groups(ids: $groupId) {
+      id
+      title
+      items_page(limit: $limit) {
+        items {
+          id
+          name
+          column_values(ids: $columnIds) {
+            id
+            text
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def fetch_items(board_id, group_id, api_key, limit=10, session=None, cache_ttl=0,
+                column_ids=None):
     """
     Fetches items from a specific group within a Monday.com board.
 
@@ -76,111 +471,791 @@ def fetch_items(board_id, group_id, api_key, limit=10):
         group_id (str): The ID of the group.
         api_key (str): Your Monday.com API key.
         limit (int): Number of items to fetch.
+        session (requests.Session): Optional session to send the request with.
+            Defaults to the shared module session.
+        cache_ttl (float): Seconds to reuse the response for repeated calls.
+            The raw response stays in memory until it expires. 0 disables
+            caching.
+        column_ids (list): Optional column IDs to fetch. Defaults to all columns;
+            naming only the needed ones shrinks the response.
 
     Returns:
         list: A list of items with their details.
+
+    Raises:
+        MondayAPIError: If the request fails, or the board or group doesn't exist.
     """
-    query = """
-    query ($boardId: [ID!]!, $groupId: [String!]!, $limit: Int!) {
-      boards(ids: $boardId) {
-        groups(ids: $groupId) {
+    variables = {
+        "boardId": [str(board_id)],    # Ensure group_id and board id is a string within a list
+        "groupId": [str(group_id)],  
+        "limit": limit,
+        **_column_variables(column_ids)
+    }
+
+    data = _run_query(_QUERY_ITEMS, variables, api_key, session, cache_ttl)
+
+    boards = data.get('data', {}).get('boards', [])
+    if not boards:
+        raise MondayAPIError(f"No boards found with ID {board_id}.")
+
+    board = boards[0]
+    groups = board.get('groups', [])
+    if not groups:
+        raise MondayAPIError(f"No groups found with ID '{group_id}' in board {board_id}.")
+
+    group = groups[0]
+    items_page = group.get('items_page', {})
+    items = items_page.get('items', [])
+
+    if not items:
+        print(f"No items found in group '{group_id}'.")
+        return []
+
+    return items
+
+
+_QUERY_FIRST_PAGE = """
+query ($boardId: [ID!]!, $groupId: [String!]!, $limit: Int!, $columnIds: [String!]) {
+  boards(ids: $boardId) {
+    groups(ids: $groupId) {
+      id
+      items_page(limit: $limit) {
+        cursor
+        items {
           id
-          title
-          items_page(limit: $limit) {
-            items {
-              id
-              name
-              column_values {
-                id
-                text
-              }
-            }
+          name
+          column_values(ids: $columnIds) {
+            id
+            text
           }
         }
       }
     }
+  }
+}
+"""
+
+_QUERY_NEXT_PAGE = """
+query ($cursor: String!, $limit: Int!, $columnIds: [String!]) {
+  next_items_page(cursor: $cursor, limit: $limit) {
+    cursor
+    items {
+      id
+      name
+      column_values(ids: $columnIds) {
+        id
+        text
+      }
+    }
+  }
+}
+"""
+
+
+def _group(data, board_id, group_id):
+    """
+    Extracts the single requested group from a GraphQL response.
+
+    Args:
+        data (dict): The decoded response to a query on one group.
+        board_id (str): The ID of the board.
+        group_id (str): The ID of the group.
+
+    Returns:
+        dict: The group.
+    """
+    boards = data.get('data', {}).get('boards', [])
+    if not boards:
+        raise MondayAPIError(f"No boards found with ID {board_id}.")
+
+    groups = boards[0].get('groups', [])
+    if not groups:
+        raise MondayAPIError(f"No groups found with ID '{group_id}' in board {board_id}.")
+
+    return groups[0]
+
+
+def _first_page(data, board_id, group_id):
     """
+    Extracts the first items page of a group from a GraphQL response.
+
+    Args:
+        data (dict): The decoded response to the first page query.
+        board_id (str): The ID of the board.
+        group_id (str): The ID of the group.
+
+    Returns:
+        dict: The items page, holding `items` and the next `cursor`.
+    """
+    return _group(data, board_id, group_id).get('items_page') or {}
+
 
+def _iter_pages(board_id, group_id, api_key, limit, session, cache_ttl, column_ids,
+                cursor=None):
+    """
+    Yields the items pages of a group, following the pagination cursor.
+
+    While the caller consumes one page, the next one is already being
+    fetched and decoded on a background thread.
+
+    Args:
+        board_id (str): The ID of the board.
+        group_id (str): The ID of the group.
+        api_key (str): Your Monday.com API key.
+        limit (int): Number of items to fetch per page.
+        session (requests.Session): The session to send the requests with, or
+            None for the shared module session.
+        cache_ttl (float): Seconds to reuse each page for repeated calls with
+            the same cursor. 0 disables caching.
+        column_ids (list): Column IDs to fetch, or None for all columns.
+        cursor (str): Optional cursor to resume from instead of the first page.
+
+    Yields:
+        tuple: The cursor the page was requested with (None for the first
+            page) and the items page, holding `items` and the next `cursor`.
+    """
+    # Built once and only re-pointed at each new cursor. That is safe with the
+    # prefetch below: the cursor changes only after the previous request using
+    # these variables has completed.
+    next_variables = {"cursor": cursor, "limit": limit, **_column_variables(column_ids)}
+
+    if cursor is None:
+        variables = {
+            "boardId": [str(board_id)],
+            "groupId": [str(group_id)],
+            "limit": limit,
+            **_column_variables(column_ids)
+        }
+        data = _run_query(_QUERY_FIRST_PAGE, variables, api_key, session, cache_ttl)
+        items_page = _first_page(data, board_id, group_id)
+    else:
+        data = _run_query(_QUERY_NEXT_PAGE, next_variables, api_key, session, cache_ttl)
+        items_page = data.get('data', {}).get('next_items_page') or {}
+
+    # Cursors chain, so at most one page can be fetched ahead of the caller.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        while True:
+            next_cursor = items_page.get('cursor')
+            if next_cursor:
+                next_variables["cursor"] = next_cursor
+                next_page = executor.submit(
+                    _run_query, _QUERY_NEXT_PAGE, next_variables, api_key, session, cache_ttl
+                )
+
+            yield cursor, items_page
+
+            if not next_cursor:
+                return
+
+            cursor = next_cursor
+            data = next_page.result()
+            items_page = data.get('data', {}).get('next_items_page') or {}
+
+
+def _read_page_cache(path, header):
+    """
+    Reads the cached pages of a group, in pagination order.
+
+    Args:
+        path (str): Path of the gzip-compressed JSON lines cache file.
+        header (dict): The header the cache must start with to be valid,
+            describing the group's item count and the requested columns.
+
+    Returns:
+        list: The cached page records chained from the first page, each
+            holding `cursor_in`, `cursor_out`, `time` and `items`. Empty when
+            there is no usable cache.
+    """
+    records = []
+    try:
+        with gzip.open(path, 'rb') as cache_file:
+            if _loads(next(cache_file)) != header:
+                return []
+            for line in cache_file:
+                records.append(_loads(line))
+    except FileNotFoundError:
+        return []
+    except (EOFError, OSError, StopIteration, ValueError, zlib.error):
+        pass  # Truncated by an interrupted run; keep what was read.
+
+    by_cursor = {record['cursor_in']: record for record in records}
+    pages = []
+    cursor = None
+    while cursor in by_cursor and len(pages) < len(records):
+        pages.append(by_cursor[cursor])
+        cursor = pages[-1]['cursor_out']
+        if not cursor:
+            break
+
+    # An unfinished chain can only be resumed while its cursors are valid,
+    # which is timed from the first page's request.
+    if pages and pages[-1]['cursor_out'] and time.time() - pages[0]['time'] > _CURSOR_LIFETIME:
+        return []
+    return pages
+
+
+def _write_page(cache_file, record):
+    """
+    Appends a record to a page cache file and flushes it to disk.
+
+    Args:
+        cache_file (gzip.GzipFile): The cache file, opened for writing.
+        record (dict): The record to write.
+    """
+    cache_file.write(_dumps(record) + b'\n')
+    cache_file.flush()
+
+
+def _iter_cached_items(board_id, group_id, api_key, limit, session, cache_ttl, column_ids,
+                       cache_dir):
+    """
+    Yields all items from a group through a persistent page cache.
+
+    Pages are stored in `<cache_dir>/<board_id>_<group_id>.jsonl.gz`, keyed
+    by the cursor they were requested with. Cached pages are replayed first
+    and only the pages after the last cached cursor are fetched. The cache
+    is discarded when the group's item count or the requested columns
+    change.
+
+    Args:
+        board_id (str): The ID of the board.
+        group_id (str): The ID of the group.
+        api_key (str): Your Monday.com API key.
+        limit (int): Number of items to fetch per page.
+        session (requests.Session): The session to send the requests with, or
+            None for the shared module session.
+        cache_ttl (float): Seconds to reuse each page for repeated calls with
+            the same cursor. 0 disables caching.
+        column_ids (list): Column IDs to fetch, or None for all columns.
+        cache_dir (str): Directory holding the page cache files.
+
+    Yields:
+        dict: Each item in the group.
+    """
+    variables = {"boardId": [str(board_id)], "groupId": [str(group_id)]}
+    data = _run_query(_QUERY_ITEMS_COUNT, variables, api_key, session)
+    header = {
+        "items_count": _group(data, board_id, group_id).get('items_count'),
+        "column_ids": _column_variables(column_ids).get('columnIds')
+    }
+
+    path = os.path.join(cache_dir, f"{board_id}_{group_id}.jsonl.gz")
+    pages = _read_page_cache(path, header)
+    for page in pages:
+        yield from page['items']
+
+    cursor = pages[-1]['cursor_out'] if pages else None
+    if pages and not cursor:
+        return
+
+    # Rewrite the valid part of the cache so that new pages extend a
+    # well-formed file, even if the previous run was interrupted mid-write.
+    os.makedirs(cache_dir, exist_ok=True)
+    with gzip.open(path, 'wb') as cache_file:
+        for record in [header, *pages]:
+            _write_page(cache_file, record)
+
+        pages = _iter_pages(board_id, group_id, api_key, limit, session, cache_ttl, column_ids,
+                            cursor)
+        for cursor_in, items_page in pages:
+            items = items_page.get('items', [])
+            _write_page(cache_file, {
+                "cursor_in": cursor_in,
+                "cursor_out": items_page.get('cursor'),
+                "time": time.time(),
+                "items": items
+            })
+            yield from items
+
+
+def iter_items_recursive(board_id, group_id, api_key, limit=MAX_PAGE_LIMIT,
+                         session=None, cache_ttl=0, column_ids=None, cache_dir=None):
+    """
+    Yields all items from a group, following the pagination cursor.
+
+    Items are yielded page by page, so only a page or two is held in memory
+    at a time. While the caller consumes one page, the next one is already
+    being fetched and decoded on a background thread.
+
+    Args:
+        board_id (str): The ID of the board.
+        group_id (str): The ID of the group.
+        api_key (str): Your Monday.com API key.
+        limit (int): Number of items to fetch per page, at most MAX_PAGE_LIMIT.
+        session (requests.Session): Optional session to send the requests with.
+            Defaults to the shared module session.
+        cache_ttl (float): Seconds to reuse each page for repeated calls with
+            the same cursor. Cached pages stay in memory until they expire,
+            so this holds the whole group rather than one page at a time.
+            0 disables caching.
+        column_ids (list): Optional column IDs to fetch. Defaults to all columns;
+            naming only the needed ones shrinks the response.
+        cache_dir (str): Optional directory in which to persist fetched pages.
+            Later runs replay them and only fetch what is missing, until the
+            group's item count changes.
+
+    Yields:
+        dict: Each item in the group.
+
+    Raises:
+        MondayAPIError: If a request fails, or the board or group doesn't exist.
+            With `cache_dir`, the pages fetched before the failure are kept,
+            and calling again resumes after them.
+    """
+    limit = min(limit, MAX_PAGE_LIMIT)
+    if cache_dir is not None:
+        yield from _iter_cached_items(board_id, group_id, api_key, limit, session, cache_ttl,
+                                      column_ids, cache_dir)
+        return
+
+    for _, items_page in _iter_pages(board_id, group_id, api_key, limit, session, cache_ttl,
+                                     column_ids):
+        yield from items_page.get('items', [])
+
+
+def fetch_items_recursive(board_id, group_id, api_key, limit=MAX_PAGE_LIMIT,
+                          session=None, cache_ttl=0, column_ids=None, cache_dir=None):
+    """
+    Fetches all items from a group, following the pagination cursor.
+
+    Args:
+        board_id (str): The ID of the board.
+        group_id (str): The ID of the group.
+        api_key (str): Your Monday.com API key.
+        limit (int): Number of items to fetch per page, at most MAX_PAGE_LIMIT.
+        session (requests.Session): Optional session to send the requests with.
+            Defaults to the shared module session.
+        cache_ttl (float): Seconds to reuse each page for repeated calls with
+            the same cursor. Cached pages stay in memory until they expire,
+            so this holds the whole group rather than one page at a time.
+            0 disables caching.
+        column_ids (list): Optional column IDs to fetch. Defaults to all columns;
+            naming only the needed ones shrinks the response.
+        cache_dir (str): Optional directory in which to persist fetched pages.
+            Later runs replay them and only fetch what is missing, until the
+            group's item count changes.
+
+    Returns:
+        list: A list of all items in the group.
+
+    Raises:
+        MondayAPIError: If a request fails, or the board or group doesn't exist.
+            With `cache_dir`, the pages fetched before the failure are kept,
+            and calling again resumes after them.
+    """
+    return list(iter_items_recursive(board_id, group_id, api_key, limit, session, cache_ttl,
+                                     column_ids, cache_dir))
+
+
+def _collect_items(stop, board_id, group_id, api_key, limit, session, cache_ttl, column_ids,
+                   cache_dir):
+    """
+    Collects all items from a group, giving up early once `stop` is set.
+
+    The check runs between items, so a stopped worker finishes at most the
+    request it already has in flight.
+
+    Args:
+        stop (threading.Event): Set when the caller no longer needs the items.
+        board_id (str): The ID of the board.
+        group_id (str): The ID of the group.
+        api_key (str): Your Monday.com API key.
+        limit (int): Number of items to fetch per page.
+        session (requests.Session): The session to send the requests with, or
+            None for the shared module session.
+        cache_ttl (float): Seconds to reuse each page for repeated calls with
+            the same cursor. 0 disables caching.
+        column_ids (list): Column IDs to fetch, or None for all columns.
+        cache_dir (str): Optional directory in which to persist fetched pages.
+
+    Returns:
+        list: The items collected before the group ended or `stop` was set.
+    """
+    items = []
+    for item in iter_items_recursive(board_id, group_id, api_key, limit, session, cache_ttl,
+                                     column_ids, cache_dir):
+        if stop.is_set():
+            break
+        items.append(item)
+    return items
+
+
+def fetch_all_groups_items(board_id, group_ids, api_key, limit=MAX_PAGE_LIMIT, max_workers=10,
+                           session=None, cache_ttl=0, column_ids=None, cache_dir=None):
+    """
+    Fetches all items from several groups, paginating them in parallel threads.
+
+    Each group is paginated by `iter_items_recursive` in its own worker, so
+    the round trips of different groups overlap. A group never has more
+    than one request in flight, so `max_workers` also bounds the load put
+    on Monday.com's rate limit.
+
+    Args:
+        board_id (str): The ID of the board.
+        group_ids (list): The IDs of the groups.
+        api_key (str): Your Monday.com API key.
+        limit (int): Number of items to fetch per page, at most MAX_PAGE_LIMIT.
+        max_workers (int): Maximum number of groups fetched at once. With the
+            shared module session it is capped at its connection pool size.
+        session (requests.Session): Optional session to send the requests with.
+            Defaults to the shared module session.
+        cache_ttl (float): Seconds to reuse each page for repeated calls with
+            the same cursor. Cached pages stay in memory until they expire,
+            so this holds the whole group rather than one page at a time.
+            0 disables caching.
+        column_ids (list): Optional column IDs to fetch. Defaults to all columns;
+            naming only the needed ones shrinks the response.
+        cache_dir (str): Optional directory in which to persist fetched pages.
+
+    Returns:
+        dict: A mapping of group ID to the list of items in that group.
+
+    Raises:
+        MondayAPIError: If a request fails, or the board or a group doesn't exist.
+            As soon as one group fails, the groups not yet started are
+            cancelled and the running ones stop after their current request.
+    """
+    if session is None:
+        max_workers = min(max_workers, _POOL_MAXSIZE)
+
+    items_by_group = {}
+    stop = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {
+            executor.submit(_collect_items, stop, board_id, group_id, api_key, limit, session,
+                            cache_ttl, column_ids, cache_dir): group_id
+            for group_id in group_ids
+        }
+        for future in as_completed(futures):
+            items_by_group[futures[future]] = future.result()
+    except BaseException:
+        # Fail fast: drop the groups still queued, tell the running ones to
+        # stop after their current request, and re-raise without waiting.
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+
+    return {group_id: items_by_group[group_id] for group_id in group_ids}
+
+
+_QUERY_GROUPS_FIRST_PAGE = """
+query ($boardId: [ID!]!, $groupIds: [String!]!, $limit: Int!, $columnIds: [String!]) {
+  boards(ids: $boardId) {
+    groups(ids: $groupIds) {
+      id
+      items_page(limit: $limit) {
+        cursor
+        items {
+          id
+          name
+          column_values(ids: $columnIds) {
+            id
+            text
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Selection of one aliased next_items_page field in a batched query.
+_NEXT_PAGE_ALIAS = """
+  g{index}: next_items_page(cursor: $c{index}, limit: $limit) {{
+    cursor
+    items {{
+      id
+      name
+      column_values(ids: $columnIds) {{
+        id
+        text
+      }}
+    }}
+  }}"""
+
+
+@functools.lru_cache(maxsize=None)
+def _batched_next_pages_query(count):
+    """
+    Builds a query fetching the next page of several cursors at once.
+
+    Each cursor is bound to variable `c<i>` and its page is returned under
+    alias `g<i>`. Queries are memoized, as the batch size repeats from one
+    round of pagination to the next.
+
+    Args:
+        count (int): Number of cursors in the batch.
+
+    Returns:
+        str: The GraphQL query.
+    """
+    params = ", ".join(f"$c{index}: String!" for index in range(count))
+    fields = "".join(_NEXT_PAGE_ALIAS.format(index=index) for index in range(count))
+    return f"query ({params}, $limit: Int!, $columnIds: [String!]) {{{fields}\n}}"
+
+
+def fetch_items_for_groups(board_id, group_ids, api_key, limit=MAX_PAGE_LIMIT,
+                           session=None, column_ids=None):
+    """
+    Fetches all items from several groups, batching them into shared queries.
+
+    The first page of every group comes back from a single query, and each
+    following round of pagination requests the next page of all unfinished
+    groups in one aliased query.
+
+    Args:
+        board_id (str): The ID of the board.
+        group_ids (list): The IDs of the groups.
+        api_key (str): Your Monday.com API key.
+        limit (int): Number of items to fetch per page and group, at most
+            MAX_PAGE_LIMIT.
+        session (requests.Session): Optional session to send the requests with.
+            Defaults to the shared module session.
+        column_ids (list): Optional column IDs to fetch. Defaults to all columns;
+            naming only the needed ones shrinks the response.
+
+    Returns:
+        dict: A mapping of group ID to the list of items in that group.
+
+    Raises:
+        MondayAPIError: If a request fails, or the board or a group doesn't exist.
+    """
+    limit = min(limit, MAX_PAGE_LIMIT)
     variables = {
-        "boardId": [str(board_id)],    # Ensure group_id and board id is a string within a list
-        "groupId": [str(group_id)],  
-        "limit": limit
+        "boardId": [str(board_id)],
+        "groupIds": [str(group_id) for group_id in group_ids],
+        "limit": limit,
+        **_column_variables(column_ids)
     }
+    data = _run_query(_QUERY_GROUPS_FIRST_PAGE, variables, api_key, session)
+
+    boards = data.get('data', {}).get('boards', [])
+    if not boards:
+        raise MondayAPIError(f"No boards found with ID {board_id}.")
+
+    groups = boards[0].get('groups', [])
+    found = {group['id'] for group in groups}
+    missing = [group_id for group_id in variables['groupIds'] if group_id not in found]
+    if missing:
+        raise MondayAPIError(f"No groups found with IDs {missing} in board {board_id}.")
+
+    items_by_group = {str(group_id): [] for group_id in group_ids}
+    cursors = {}
+    for group in groups:
+        items_page = group.get('items_page') or {}
+        items_by_group[group['id']] = list(items_page.get('items', []))
+        if items_page.get('cursor'):
+            cursors[group['id']] = items_page['cursor']
+
+    shared_variables = {"limit": limit, **_column_variables(column_ids)}
+    while cursors:
+        pending = list(cursors.items())
+        variables = {f"c{index}": cursor for index, (_, cursor) in enumerate(pending)}
+        variables.update(shared_variables)
+        data = _run_query(_batched_next_pages_query(len(pending)), variables, api_key, session)
+
+        pages = data.get('data', {})
+        cursors = {}
+        for index, (group_id, _) in enumerate(pending):
+            items_page = pages.get(f"g{index}") or {}
+            items_by_group[group_id].extend(items_page.get('items', []))
+            if items_page.get('cursor'):
+                cursors[group_id] = items_page['cursor']
+
+    return items_by_group
+
+
+async def _run_query_async(session, query, variables, api_key, semaphore=None):
+    """
+    Sends a GraphQL query through an aiohttp session.
 
+    Throttled queries and transient server errors are retried with
+    exponential backoff, honouring the delay Monday.com suggests if any.
+
+    Args:
+        session (aiohttp.ClientSession): The session to send the request with.
+        query (str): The GraphQL query.
+        variables (dict): Variables for the query.
+        api_key (str): Your Monday.com API key.
+        semaphore (asyncio.Semaphore): Optional semaphore bounding the number
+            of requests in flight.
+
+    Returns:
+        dict: The decoded GraphQL response.
+
+    Raises:
+        MondayAPIError: If the request fails; MondayRateLimit if it is still
+            throttled after every retry, MondayGraphQLError if it is rejected.
+    """
     headers = {
         'Authorization': api_key,
         'Content-Type': 'application/json'
     }
+    body = _dumps({"query": query, "variables": variables})
 
-    response = requests.post(
-        "https://api.monday.com/v2",
-        json={"query": query, "variables": variables},
-        headers=headers
-    )
+    for attempt in range(_MAX_RETRIES + 1):
+        async with (semaphore or contextlib.nullcontext()):
+            async with session.post(API_URL, data=body, headers=headers) as response:
+                content = await response.read()
+                retry_after = response.headers.get('Retry-After')
 
-    if response.status_code != 200:
-        print(f"Query failed with status code {response.status_code}")
-        print("Response:", response.text)
-        sys.exit(1)
+        if response.status == 200:
+            data = _loads(content)
+            throttled, hint = _throttle_hint(data)
+            if not throttled or attempt == _MAX_RETRIES:
+                _check_errors(data)
+                return data
+            retry_after = hint or retry_after
 
-    data = response.json()
+        elif response.status not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+            raise _status_error(response.status, content.decode('utf-8', errors='replace'))
 
-    if 'errors' in data:
-        print("GraphQL Errors:")
-        for error in data['errors']:
-            print(error['message'])
-        sys.exit(1)
+        # Sleep outside the semaphore so other requests can proceed meanwhile.
+        await asyncio.sleep(_backoff(attempt, retry_after))
 
-    boards = data.get('data', {}).get('boards', [])
-    if not boards:
-        print(f"No boards found with ID {board_id}.")
-        sys.exit(1)
 
-    board = boards[0]
-    groups = board.get('groups', [])
-    if not groups:
-        print(f"No groups found with ID '{group_id}' in board {board_id}.")
-        sys.exit(1)
+async def fetch_items_recursive_async(session, board_id, group_id, api_key,
+                                      limit=MAX_PAGE_LIMIT, semaphore=None, column_ids=None):
+    """
+    Fetches all items from a group, following the pagination cursor.
 
-    group = groups[0]
-    items_page = group.get('items_page', {})
-    items = items_page.get('items', [])
+    Asynchronous counterpart of `fetch_items_recursive`, so that several
+    groups can be paginated concurrently over one aiohttp session.
 
-    if not items:
-        print(f"No items found in group '{group_id}'.")
-        return []
+    Args:
+        session (aiohttp.ClientSession): The session to send the requests with.
+        board_id (str): The ID of the board.
+        group_id (str): The ID of the group.
+        api_key (str): Your Monday.com API key.
+        limit (int): Number of items to fetch per page, at most MAX_PAGE_LIMIT.
+        semaphore (asyncio.Semaphore): Optional semaphore bounding the number
+            of requests in flight.
+        column_ids (list): Optional column IDs to fetch. Defaults to all columns;
+            naming only the needed ones shrinks the response.
+
+    Returns:
+        list: A list of all items in the group.
+
+    Raises:
+        MondayAPIError: If a request fails, or the board or group doesn't exist.
+    """
+    limit = min(limit, MAX_PAGE_LIMIT)
+    variables = {
+        "boardId": [str(board_id)],
+        "groupId": [str(group_id)],
+        "limit": limit,
+        **_column_variables(column_ids)
+    }
+    data = await _run_query_async(session, _QUERY_FIRST_PAGE, variables, api_key, semaphore)
+    items_page = _first_page(data, board_id, group_id)
+
+    all_items = list(items_page.get('items', []))
+    cursor = items_page.get('cursor')
+
+    next_variables = {"cursor": None, "limit": limit, **_column_variables(column_ids)}
+    while cursor:
+        next_variables["cursor"] = cursor
+        data = await _run_query_async(session, _QUERY_NEXT_PAGE, next_variables, api_key,
+                                      semaphore)
+        items_page = data.get('data', {}).get('next_items_page') or {}
+        all_items.extend(items_page.get('items', []))
+        cursor = items_page.get('cursor')
+
+    return all_items
+
+
+async def fetch_groups_items_async(board_id, group_ids, api_key, limit=MAX_PAGE_LIMIT,
+                                   max_concurrency=20, column_ids=None):
+    """
+    Fetches all items from several groups concurrently.
+
+    Run it from synchronous code with
+    `asyncio.run(fetch_groups_items_async(board_id, group_ids, api_key))`.
+    Requires the optional `aiohttp` package.
+
+    Args:
+        board_id (str): The ID of the board.
+        group_ids (list): The IDs of the groups.
+        api_key (str): Your Monday.com API key.
+        limit (int): Number of items to fetch per page, at most MAX_PAGE_LIMIT.
+        max_concurrency (int): Maximum number of requests in flight, to stay
+            under Monday.com's rate limit.
+        column_ids (list): Optional column IDs to fetch. Defaults to all columns;
+            naming only the needed ones shrinks the response.
+
+    Returns:
+        dict: A mapping of group ID to the list of items in that group.
+
+    Raises:
+        MondayAPIError: If a request fails, or the board or a group doesn't exist.
+    """
+    import aiohttp
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    connector = aiohttp.TCPConnector(limit_per_host=64)
+
+    async with aiohttp.ClientSession(connector=connector) as session:
+        tasks = [
+            fetch_items_recursive_async(session, board_id, group_id, api_key, limit, semaphore,
+                                        column_ids)
+            for group_id in group_ids
+        ]
+        results = await asyncio.gather(*tasks)
+
+    return dict(zip(group_ids, results))
+
+
+def _item_row(item, column_ids):
+    """
+    Flattens an item into a CSV row ordered by `column_ids`.
+
+    Monday.com returns every item's columns in the same board order, so the
+    texts are normally taken positionally; a per-item id lookup is only
+    built when an item's columns differ from `column_ids`.
+
+    Args:
+        item (dict): The item to flatten.
+        column_ids (list): The column IDs, in CSV column order.
+
+    Returns:
+        tuple: The item ID, item name and the text of each column.
+    """
+    columns = item['column_values']
+    if list(map(operator.itemgetter('id'), columns)) == column_ids:
+        return (item['id'], item['name'], *[column.get('text', '') for column in columns])
+
+    texts = {column['id']: column.get('text', '') for column in columns}
+    return (item['id'], item['name'], *[texts.get(column_id, '') for column_id in column_ids])
 
-    return items
 
 def export_items_to_csv(items, filename='scheduled_items.csv'):
     """
     Exports fetched items to a CSV file.
 
+    Rows are written as items are consumed, so `items` can be a generator
+    such as `iter_items_recursive` to stream a large group straight to disk.
+
     Args:
-        items (list): List of items to export.
+        items (iterable): Items to export.
         filename (str): The name of the CSV file.
     """
-    if not items:
+    items = iter(items)
+    first = next(items, None)
+    if first is None:
         print("No items to export.")
         return
 
-    headers = ['Item ID', 'Item Name']
-    column_ids = []
-    for column in items[0]['column_values']:
-        headers.append(column['id'])
-        column_ids.append(column['id'])
-
-    with open(filename, mode='w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=headers)
-        writer.writeheader()
-
-        for item in items:
-            row = {
-                'Item ID': item['id'],
-                'Item Name': item['name']
-            }
-            for column in item['column_values']:
-                row[column['id']] = column.get('text', '')
-            writer.writerow(row)
-
-    print(f"Exported {len(items)} items to {filename}.")
\ No newline at end of file
+    column_ids = [column['id'] for column in first['column_values']]
+
+    count = 0
+    with open(filename, mode='w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(['Item ID', 'Item Name', *column_ids])
+
+        for item in itertools.chain([first], items):
+            writer.writerow(_item_row(item, column_ids))
+            count += 1
+
+    print(f"Exported {count} items to {filename}.")